@@ -1,15 +1,20 @@
 import streamlit as st
 import bcrypt
 import json
+import orjson
 import os
+import tempfile
+import math
+import time
 import numpy as np
 from skyfield.api import load, EarthSatellite, wgs84
-from datetime import datetime, timedelta
+from skyfield.sgp4lib import TEME_to_ITRF
+from sgp4.api import SatrecArray, jday
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import pytz
-import folium
-from streamlit_folium import st_folium
-import time
+import pydeck as pdk
+import streamlit.components.v1 as components
 import pandas as pd
 import plotly.express as px
 
@@ -18,12 +23,23 @@ st.set_page_config(page_title="ASAL Satellite Tracker", page_icon="🛰️", lay
 USERS_FILE = "users.json"
 FAV_FILE = "favorites.json"
 HISTORY_FILE = "pass_history.json"
+# bcrypt cost for new passwords; stored hashes carry their own cost ($2b$<rounds>$...) so older ones still verify
+BCRYPT_ROUNDS = 10
 CDS_LAT = 35.7025
 CDS_LON = -0.621389
+_CDS_LAT_R = math.radians(CDS_LAT)
+_CDS_LON_R = math.radians(CDS_LON)
+_COS_CDS = math.cos(_CDS_LAT_R)
+_SIN_CDS = math.sin(_CDS_LAT_R)
+TS = load.timescale(builtin=True)
+OBSERVER = wgs84.latlon(CDS_LAT, CDS_LON)
+# A satellite counts as "above the CDS" when it culminates this close to the zenith
+OVERHEAD_ALTITUDE_DEG = 80.0
 
 # Telegram Configuration
 TELEGRAM_BOT_TOKEN = st.secrets.get("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = st.secrets.get("TELEGRAM_CHAT_ID", "")
+_NOTIFY_ENABLED = bool(TELEGRAM_BOT_TOKEN) and bool(TELEGRAM_CHAT_ID)
 
 SATELLITES = {
     "ALSAT-1": 27559,
@@ -34,54 +50,93 @@ SATELLITES = {
 }
 
 # ----------------- UTILITY FUNCTIONS -----------------
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance in km between two geographic points"""
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-    c = 2 * np.arcsin(np.sqrt(a)) 
-    r = 6371
-    return c * r
-
-def send_telegram_notification(message):
-    """Send notification via Telegram"""
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        st.warning("Missing Telegram configuration. Notifications disabled.")
-        return False
-    
+def find_overhead_samples(satellite, aos, los, step_seconds=30):
+    """Sample a pass in one batched propagation and return the points near the zenith of the CDS"""
+    secs = np.arange(0, (los - aos).total_seconds(), step_seconds)
+    check_times = TS.utc(aos + np.array([timedelta(seconds=int(s)) for s in secs]))
+    alt, _, distance = (satellite - OBSERVER).at(check_times).altaz()
+
+    return [(aos + timedelta(seconds=int(secs[idx])), alt.degrees[idx], distance.km[idx])
+            for idx in np.flatnonzero(alt.degrees > OVERHEAD_ALTITUDE_DEG)]
+
+@st.cache_resource
+def _http_session():
+    """Shared HTTP session (keep-alive) for Celestrak and Telegram"""
+    return requests.Session()
+
+@st.cache_resource
+def _telegram_executor():
+    """Background workers that deliver Telegram messages"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def _post_telegram(session, url, params):
+    """Post a Telegram message (runs on the notification worker threads)"""
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        params = {
-            "chat_id": TELEGRAM_CHAT_ID,
-            "text": message,
-            "parse_mode": "HTML"
-        }
-        response = requests.post(url, params=params, timeout=10)
+        response = session.post(url, params=params, timeout=10)
         return response.status_code == 200
-    except Exception as e:
-        st.error(f"Telegram sending error: {str(e)}")
+    except requests.RequestException:
         return False
 
+def _send_telegram(message):
+    """Queue a Telegram notification; returns a future resolving to the send status"""
+    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    params = {
+        "chat_id": TELEGRAM_CHAT_ID,
+        "text": message,
+        "parse_mode": "HTML"
+    }
+    return _telegram_executor().submit(_post_telegram, _http_session(), url, params)
+
+def _notifications_disabled(message):
+    """Stand-in sender used when Telegram is not configured"""
+    return False
+
+send_telegram_notification = _send_telegram if _NOTIFY_ENABLED else _notifications_disabled
+
 # ----------------- USER MANAGEMENT FUNCTIONS -----------------
+@st.cache_resource
+def _json_cache():
+    """In-memory copy of the JSON data files, shared across reruns"""
+    return {}
+
+def _read_json(path):
+    """Read a JSON file once and serve it from memory afterwards"""
+    cache = _json_cache()
+    if path not in cache:
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            cache[path] = orjson.loads(f.read())
+    return cache[path]
+
+def _write_json(path, data, option=None):
+    """Atomically write a JSON file, then refresh its in-memory copy"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _json_cache()[path] = data
+
 def load_users():
     """Load users from JSON file"""
-    if not os.path.exists(USERS_FILE):
-        return {}
-    with open(USERS_FILE, "r") as f:
-        return json.load(f)
+    users = _read_json(USERS_FILE)
+    return users if users is not None else {}
 
 def save_users(users):
     """Save users to JSON file"""
-    with open(USERS_FILE, "w") as f:
-        json.dump(users, f, indent=4)
+    _write_json(USERS_FILE, users, orjson.OPT_INDENT_2)
 
 def register_user(name, email, password):
     """Register a new user"""
-    users = load_users()
+    users = dict(load_users())
     if email in users:
         return False
-    hashed_pw = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    hashed_pw = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
     users[email] = {
         "name": name, 
         "email": email, 
@@ -100,30 +155,28 @@ def authenticate_user(email, password):
 
 def load_favorites():
     """Load favorite satellites"""
-    if os.path.exists(FAV_FILE):
-        with open(FAV_FILE, "r") as f:
-            favorites_data = json.load(f)
-            if isinstance(favorites_data, list):
-                new_format = {"default@user.com": favorites_data}
-                save_favorites(new_format)
-                return new_format
-            return favorites_data
-    return {}
+    favorites_data = _read_json(FAV_FILE)
+    if favorites_data is None:
+        return {}
+    if isinstance(favorites_data, list):
+        new_format = {"default@user.com": favorites_data}
+        save_favorites(new_format)
+        return new_format
+    return favorites_data
 
 def save_favorites(favs):
     """Save favorite satellites"""
-    with open(FAV_FILE, "w") as f:
-        json.dump(favs, f)
+    _write_json(FAV_FILE, favs)
 
 def get_user_favorites(email):
     """Get user's favorites"""
     favorites_data = load_favorites()
-    return favorites_data.get(email, [])
+    return list(favorites_data.get(email, []))
 
 def save_user_favorites(email, favorites):
     """Save user's favorites"""
-    favorites_data = load_favorites()
-    favorites_data[email] = favorites
+    favorites_data = dict(load_favorites())
+    favorites_data[email] = list(favorites)
     save_favorites(favorites_data)
 
 @st.cache_data(ttl=3600)
@@ -137,11 +190,28 @@ def load_satellite_info():
         return {}
 
 @st.cache_data(ttl=3600)
-def fetch_tle_from_celestrak(norad_id):
-    """Fetch TLE data from Celestrak"""
+def fetch_all_tles():
+    """Fetch the TLEs of all ALSAT satellites from Celestrak in one request"""
+    url = "https://celestrak.org/NORAD/elements/gp.php?NAME=ALSAT&FORMAT=TLE"
+    tles = {}
+    try:
+        response = _http_session().get(url, timeout=10)
+        if response.status_code == 200:
+            lines = [line.strip() for line in response.text.strip().splitlines()]
+            for i in range(0, len(lines) - 2, 3):
+                tle1, tle2 = lines[i+1], lines[i+2]
+                if tle1.startswith("1 ") and tle2.startswith("2 "):
+                    tles[int(tle1[2:7])] = (tle1, tle2)
+    except Exception as e:
+        st.error(f"TLE retrieval error: {str(e)}")
+    return tles
+
+@st.cache_data(ttl=3600)
+def fetch_single_tle(norad_id):
+    """Fetch the TLE of one satellite from Celestrak"""
     url = f"https://celestrak.org/NORAD/elements/gp.php?CATNR={norad_id}&FORMAT=TLE"
     try:
-        response = requests.get(url, timeout=10)
+        response = _http_session().get(url, timeout=10)
         if response.status_code == 200:
             lines = response.text.strip().splitlines()
             if len(lines) >= 3:
@@ -150,19 +220,48 @@ def fetch_tle_from_celestrak(norad_id):
         st.error(f"TLE retrieval error: {str(e)}")
     return None, None
 
-def get_next_passes(name, norad_id, send_notification=False):
-    """Get upcoming visible passes"""
-    tle1, tle2 = fetch_tle_from_celestrak(norad_id)
-    if not tle1 or not tle2:
-        return [], (None, None)
-
-    satellite = EarthSatellite(tle1, tle2, name)
-    ts = load.timescale()
-    observer = wgs84.latlon(CDS_LAT, CDS_LON)
-    now = ts.now()
-    end_time = ts.utc(now.utc_datetime() + timedelta(days=2))
-
-    times, events = satellite.find_events(observer, now, end_time, altitude_degrees=10.0)
+def fetch_tle_from_celestrak(norad_id):
+    """Look up a TLE in the ALSAT bundle, querying the satellite alone as fallback"""
+    return fetch_all_tles().get(norad_id) or fetch_single_tle(norad_id)
+
+@st.cache_resource(max_entries=4 * len(SATELLITES))
+def build_satellite(tle1, tle2, name):
+    """Build (and cache) the Skyfield satellite for a TLE"""
+    return EarthSatellite(tle1, tle2, name)
+
+def notify_overhead(name, overhead_time, altitude, distance):
+    """Alert when the satellite is about to fly over the CDS"""
+    alert_ts = overhead_time.timestamp() - 60
+    now_ts = time.time()
+
+    if now_ts <= alert_ts <= now_ts + 60:
+        msg = (f"🛰️ {name} est AU-DESSUS DU CDS MAINTENANT!\n"
+              f"• Heure: {overhead_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+              f"• Élévation: {altitude:.1f}°\n"
+              f"• Distance au CDS: {distance:.0f} km")
+        send_telegram_notification(f"ALERTE CDS\n{msg}")
+
+def notify_pass(name, aos_time, los_time):
+    """Alert 5 minutes before a pass starts"""
+    #alert_ts = aos_time.timestamp() - (4 * 3600 + 10 * 60)
+    alert_ts = aos_time.timestamp() - 5 * 60
+    now_ts = time.time()
+    
+    if now_ts <= alert_ts <= now_ts + 5 * 60:
+        msg = (f"🛰️ {name} arriving in 5 minutes!\n"
+              f"• Start: {aos_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+              f"• End: {los_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+              f"• Duration: {(los_time-aos_time).seconds//60} min")
+        send_telegram_notification(f"PASS ALERT\n{msg}")
+
+@st.cache_data(ttl=600)
+def _compute_passes(tle1, tle2, name):
+    """Compute the passes over the next 48 hours (cached for 10 minutes per TLE)"""
+    satellite = build_satellite(tle1, tle2, name)
+    now = TS.now()
+    end_time = TS.utc(now.utc_datetime() + timedelta(days=2))
+
+    times, events = satellite.find_events(OBSERVER, now, end_time, altitude_degrees=10.0)
     passes = []
     
     for i in range(len(events)):
@@ -172,46 +271,78 @@ def get_next_passes(name, norad_id, send_notification=False):
             
             if los_time:
                 passes.append((aos_time, los_time))
-                
-                if send_notification:
-                    # Vérifier si le satellite passe au-dessus du CDS
-                    check_interval = timedelta(seconds=30)
-                    current_check = aos_time
-                    
-                    while current_check < los_time:
-                        t = ts.utc(current_check)
-                        pos = satellite.at(t).subpoint()
-                        distance = calculate_distance(pos.latitude.degrees, pos.longitude.degrees, 
-                                                    CDS_LAT, CDS_LON)
-                        
-                        if distance < 10:
-                            overhead_time = current_check
-                            alert_time = overhead_time - timedelta(minutes=1)
-                            current_time = datetime.now(pytz.utc)
-                            
-                            if current_time <= alert_time <= current_time + timedelta(minutes=1):
-                                msg = (f"🛰️ {name} est AU-DESSUS DU CDS MAINTENANT!\n"
-                                      f"• Heure: {overhead_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                                      f"• Altitude: {pos.elevation.km:.1f} km\n"
-                                      f"• Distance au CDS: {distance:.2f} km")
-                                send_telegram_notification(f"ALERTE CDS\n{msg}")
-                        
-                        current_check += check_interval
-                    
-                    # Notification 5 minutes avant le passage
-                    #alert_time = aos_time - timedelta(hours=4, minutes=10)
-
-                    alert_time = aos_time - timedelta(minutes=5)
-                    current_time = datetime.now(pytz.utc)
-                    
-                    if current_time <= alert_time <= current_time + timedelta(minutes=5):
-                        msg = (f"🛰️ {name} arriving in 5 minutes!\n"
-                              f"• Start: {aos_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                              f"• End: {los_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                              f"• Duration: {(los_time-aos_time).seconds//60} min")
-                        send_telegram_notification(f"PASS ALERT\n{msg}")
+    return passes
+
+def _maybe_notify(satellite, passes):
+    """Send the CDS overflight and upcoming pass alerts (never cached)"""
+    for aos_time, los_time in passes:
+        # Vérifier si le satellite passe au-dessus du CDS
+        for overhead_time, altitude, distance in find_overhead_samples(satellite, aos_time, los_time):
+            notify_overhead(satellite.name, overhead_time, altitude, distance)
+        
+        # Notification 5 minutes avant le passage
+        notify_pass(satellite.name, aos_time, los_time)
+
+def get_next_passes(name, norad_id, send_notification=False):
+    """Get upcoming visible passes"""
+    tle1, tle2 = fetch_tle_from_celestrak(norad_id)
+    if not tle1 or not tle2:
+        return [], (None, None)
+
+    passes = _compute_passes(tle1, tle2, name)
+    if send_notification and _NOTIFY_ENABLED:
+        _maybe_notify(build_satellite(tle1, tle2, name), passes)
     return passes, (tle1, tle2)
 
+def check_favorite_passes(names, send_notification=False, step_seconds=30):
+    """Propagate all favorite satellites over the next 48 hours in one SGP4 batch and send alerts"""
+    if not send_notification or not _NOTIFY_ENABLED:
+        return
+
+    satellites = []
+    for name in names:
+        norad_id = SATELLITES.get(name)
+        tle1, tle2 = fetch_tle_from_celestrak(norad_id) if norad_id else (None, None)
+        if tle1 and tle2:
+            satellites.append(build_satellite(tle1, tle2, name))
+    if not satellites:
+        return
+
+    start = datetime.now(timezone.utc).replace(microsecond=0)
+    secs = np.arange(0, 2 * 86400, step_seconds)
+    jd0, fr0 = jday(start.year, start.month, start.day, start.hour, start.minute, start.second)
+    fr = fr0 + secs / 86400.0
+    jd = np.full_like(fr, jd0)
+    times = TS.utc(start.year, start.month, start.day, start.hour, start.minute, start.second + secs)
+
+    sat_array = SatrecArray([satellite.model for satellite in satellites])
+    errors, r_teme, v_teme = sat_array.sgp4(jd, fr)
+
+    obs_itrf = OBSERVER.itrs_xyz.km
+    up = np.array([_COS_CDS * math.cos(_CDS_LON_R), _COS_CDS * math.sin(_CDS_LON_R), _SIN_CDS])
+
+    for k, satellite in enumerate(satellites):
+        r_itrf, _ = TEME_to_ITRF(times.whole, r_teme[k].T, v_teme[k].T, 0.0, 0.0, times.ut1_fraction)
+        ok = errors[k] == 0
+        rel = r_itrf - obs_itrf[:, None]
+        distances = np.linalg.norm(rel, axis=0)
+        altitude = np.degrees(np.arcsin(up @ rel / distances))
+
+        for idx in np.flatnonzero(ok & (altitude > OVERHEAD_ALTITUDE_DEG)):
+            overhead_time = start + timedelta(seconds=int(secs[idx]))
+            notify_overhead(satellite.name, overhead_time, altitude[idx], distances[idx])
+
+        # AOS/LOS are the 10° elevation crossings seen from the CDS
+        visible = ok & (altitude > 10.0)
+        rises = np.flatnonzero(~visible[:-1] & visible[1:]) + 1
+        sets = np.flatnonzero(visible[:-1] & ~visible[1:]) + 1
+        for rise in rises:
+            later_sets = sets[sets > rise]
+            if later_sets.size:
+                aos_time = start + timedelta(seconds=int(secs[rise]))
+                los_time = start + timedelta(seconds=int(secs[later_sets[0]]))
+                notify_pass(satellite.name, aos_time, los_time)
+
 
 # ----------------- AUTH INTERFACE -----------------
 def show_authentication():
@@ -230,7 +361,7 @@ def show_authentication():
                 st.error("❌ Passwords don't match.")
             else:
                 if register_user(name, email, password):
-                    favorites_data = load_favorites()
+                    favorites_data = dict(load_favorites())
                     favorites_data[email] = []
                     save_favorites(favorites_data)
                     st.success("✅ Account created. Please login now.")
@@ -281,43 +412,55 @@ def show_satellite_info(sat_data, norad_id):
 def show_satellite_map(tle_lines):
     """Show satellite position on map"""
     try:
-        m = folium.Map(
-            location=[CDS_LAT, CDS_LON],
-            zoom_start=5,
-            tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
-            attr='Esri',
-            prefer_canvas=True
-        )
-
-        folium.Marker(
-            [CDS_LAT, CDS_LON],
-            popup="Satellite Development Center",
-            icon=folium.Icon(color='green')
-        ).add_to(m)
-
-        satellite = EarthSatellite(*tle_lines, st.session_state.selected_satellite)
-        ts = load.timescale()
-        now = ts.now()
+        satellite = build_satellite(*tle_lines, st.session_state.selected_satellite)
+        now = TS.now()
 
         pos = satellite.at(now).subpoint()
-        folium.Marker(
-            [pos.latitude.degrees, pos.longitude.degrees],
-            popup=f"""
-                <b>{st.session_state.selected_satellite}</b><br>
-                Current position<br>
-                Lat: {pos.latitude.degrees:.4f}°<br>
-                Lon: {pos.longitude.degrees:.4f}°<br>
-                Alt: {pos.elevation.km:.1f} km
-            """,
-            icon=folium.Icon(color='red', icon='satellite', prefix='fa')
-        ).add_to(m)
 
         minutes_range = np.linspace(-45, 45, 180)
-        times = ts.utc(now.utc_datetime() + np.array([timedelta(minutes=m) for m in minutes_range]))
-        lat_lon = [(satellite.at(t).subpoint().latitude.degrees, satellite.at(t).subpoint().longitude.degrees) for t in times]
-        folium.PolyLine(lat_lon, color='yellow', weight=2.5, opacity=0.8).add_to(m)
-
-        st_folium(m, width=700, height=500, returned_objects=[], use_container_width=True)
+        times = TS.utc(now.utc_datetime() + np.array([timedelta(minutes=float(m)) for m in minutes_range]))
+        track = satellite.at(times).subpoint()
+        path = np.column_stack([track.longitude.degrees, track.latitude.degrees]).tolist()
+
+        markers = [
+            {
+                "position": [CDS_LON, CDS_LAT],
+                "color": [0, 160, 0],
+                "info": "Satellite Development Center",
+            },
+            {
+                "position": [pos.longitude.degrees, pos.latitude.degrees],
+                "color": [220, 0, 0],
+                "info": (f"<b>{st.session_state.selected_satellite}</b><br>"
+                         f"Current position<br>"
+                         f"Lat: {pos.latitude.degrees:.4f}°<br>"
+                         f"Lon: {pos.longitude.degrees:.4f}°<br>"
+                         f"Alt: {pos.elevation.km:.1f} km"),
+            },
+        ]
+
+        deck = pdk.Deck(
+            layers=[
+                pdk.Layer(
+                    "PathLayer",
+                    data=[{"path": path}],
+                    get_path="path",
+                    get_color=[255, 255, 0, 204],
+                    width_min_pixels=2.5,
+                ),
+                pdk.Layer(
+                    "ScatterplotLayer",
+                    data=markers,
+                    get_position="position",
+                    get_fill_color="color",
+                    radius_min_pixels=7,
+                    pickable=True,
+                ),
+            ],
+            initial_view_state=pdk.ViewState(latitude=CDS_LAT, longitude=CDS_LON, zoom=3),
+            tooltip={"html": "{info}"},
+        )
+        st.pydeck_chart(deck, use_container_width=True)
 
     except Exception as e:
         st.error(f"Map creation error: {str(e)}")
@@ -326,38 +469,25 @@ def show_results(passes, tle_lines):
     """Show pass results and TLE data"""
     st.subheader(f"Data for {st.session_state.selected_satellite}")
     
-    if not st.session_state.countdown_placeholder:
-        st.session_state.countdown_placeholder = st.empty()
-    
     if passes:
-        now_utc = datetime.now(pytz.utc)
-        display_text = ""
+        pass_rows = []
         
-        for i, (aos, los) in enumerate(passes, 1):
+        for aos, los in passes:
             duration = los - aos
-            countdown = aos - now_utc
-            
-            satellite = EarthSatellite(*tle_lines, st.session_state.selected_satellite)
-            ts = load.timescale()
-            check_times = [ts.utc(aos + timedelta(seconds=x*30)) 
-                          for x in range(int(duration.total_seconds()/30))]
             
-            overhead_times = []
-            for t in check_times:
-                pos = satellite.at(t).subpoint()
-                distance = calculate_distance(pos.latitude.degrees, pos.longitude.degrees,
-                                             CDS_LAT, CDS_LON)
-                if distance < 10:
-                    overhead_times.append(t.utc_datetime())
+            satellite = build_satellite(*tle_lines, st.session_state.selected_satellite)
+            overhead_times = [t for t, _, _ in find_overhead_samples(satellite, aos, los)]
             
-            if overhead_times:
-                overhead_str = "\n- Above CDS at: " + ", ".join(
-                    [t.strftime('%H:%M:%S UTC') for t in overhead_times])
-                display_text += f"📡 Pass #{i}:\n- Start: {aos.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- End: {los.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Duration: {str(duration).split('.')[0]}\n- Countdown: {str(countdown).split('.')[0]}{overhead_str}\n\n"
-            else:
-                display_text += f"📡 Pass #{i}:\n- Start: {aos.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- End: {los.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Duration: {str(duration).split('.')[0]}\n- Countdown: {str(countdown).split('.')[0]}\n\n"
+            pass_rows.append({
+                "aos": aos.timestamp(),
+                "los": los.timestamp(),
+                "start": aos.strftime('%Y-%m-%d %H:%M:%S UTC'),
+                "end": los.strftime('%Y-%m-%d %H:%M:%S UTC'),
+                "duration": str(duration).split('.')[0],
+                "overhead": ", ".join([t.strftime('%H:%M:%S UTC') for t in overhead_times]),
+            })
 
-        st.session_state.countdown_placeholder.markdown(display_text)
+        show_countdown(pass_rows)
 
         st.write("📄 Automatically updated TLE:")
         tle_text = f"0 {st.session_state.selected_satellite}\n{tle_lines[0]}\n{tle_lines[1]}"
@@ -368,31 +498,60 @@ def show_results(passes, tle_lines):
     else:
         st.warning("No visible passes in the next 48 hours or TLE unavailable.")
 
-def update_countdown():
-    """Update countdown dynamically"""
-    if st.session_state.pass_data and st.session_state.countdown_placeholder:
-        while True:
-            time.sleep(1)
-            now_utc = datetime.now(pytz.utc)
-            updated_text = ""
-            
-            for i, (aos, los) in enumerate(st.session_state.pass_data, 1):
-                duration = los - aos
-                countdown = aos - now_utc
-                
-                if countdown.total_seconds() > 0:
-                    updated_text += f"📡 Pass #{i}:\n- Start: {aos.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- End: {los.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Duration: {str(duration).split('.')[0]}\n- Countdown: {str(countdown).split('.')[0]}\n\n"
-                else:
-                    if now_utc < los:
-                        elapsed = now_utc - aos
-                        updated_text += f"🚀 Pass #{i} IN PROGRESS:\n- Start: {aos.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- End: {los.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Duration: {str(duration).split('.')[0]}\n- Elapsed: {str(elapsed).split('.')[0]}\n\n"
-                    else:
-                        updated_text += f"✅ Pass #{i} COMPLETED:\n- Start: {aos.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- End: {los.strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Duration: {str(duration).split('.')[0]}\n\n"
-            
-            st.session_state.countdown_placeholder.markdown(updated_text)
-            
-            if not st.session_state.get("is_authenticated", False):
-                break
+COUNTDOWN_HTML = """
+<div id="countdown" style="font-family: sans-serif; white-space: pre-line; line-height: 1.6;"></div>
+<script>
+const passes = __PASSES__;
+function fmt(seconds) {
+    seconds = Math.floor(seconds);
+    const days = Math.floor(seconds / 86400);
+    const h = Math.floor((seconds % 86400) / 3600);
+    const m = String(Math.floor((seconds % 3600) / 60)).padStart(2, "0");
+    const s = String(seconds % 60).padStart(2, "0");
+    return (days ? days + (days > 1 ? " days, " : " day, ") : "") + h + ":" + m + ":" + s;
+}
+function render() {
+    const now = Date.now() / 1000;
+    let text = "";
+    passes.forEach((p, idx) => {
+        const i = idx + 1;
+        if (now < p.aos) {
+            text += `📡 Pass #${i}:\n`;
+        } else if (now < p.los) {
+            text += `🚀 Pass #${i} IN PROGRESS:\n`;
+        } else {
+            text += `✅ Pass #${i} COMPLETED:\n`;
+        }
+        text += `- Start: ${p.start}\n- End: ${p.end}\n- Duration: ${p.duration}\n`;
+        if (now < p.aos) {
+            text += `- Countdown: ${fmt(p.aos - now)}\n`;
+        } else if (now < p.los) {
+            text += `- Elapsed: ${fmt(now - p.aos)}\n`;
+        }
+        if (p.overhead) {
+            text += `- Above CDS at: ${p.overhead}\n`;
+        }
+        text += "\n";
+    });
+    document.getElementById("countdown").textContent = text;
+}
+render();
+setInterval(render, 1000);
+</script>
+"""
+
+def show_countdown(pass_rows):
+    """Render the pass list with a countdown that ticks in the browser"""
+    html = COUNTDOWN_HTML.replace("__PASSES__", json.dumps(pass_rows, ensure_ascii=False))
+    components.html(html, height=170 * len(pass_rows))
+
+@st.fragment(run_every="60s")
+def watch_favorites():
+    """Check favorite passes every minute without rerunning the whole page"""
+    # Stamp before checking and allow some slack so a 60 s tick is never skipped
+    if time.time() - st.session_state.last_checked >= 55:
+        st.session_state.last_checked = time.time()
+        check_favorite_passes(st.session_state.favorites, st.session_state.enable_notifications)
 
 # ----------------- MAIN FUNCTION -----------------
 def main():
@@ -411,11 +570,9 @@ def main():
     if "enable_notifications" not in st.session_state:
         st.session_state.enable_notifications = False
     if "last_checked" not in st.session_state:
-        st.session_state.last_checked = datetime.min
+        st.session_state.last_checked = 0.0
     if "pass_data" not in st.session_state:
         st.session_state.pass_data = None
-    if "countdown_placeholder" not in st.session_state:
-        st.session_state.countdown_placeholder = None
 
     # Show authentication if not logged in
     if not st.session_state.is_authenticated:
@@ -447,6 +604,8 @@ def main():
         "Enable Telegram notifications",
         value=st.session_state.enable_notifications
     )
+    if st.session_state.enable_notifications and not _NOTIFY_ENABLED:
+        st.sidebar.warning("Missing Telegram configuration. Notifications disabled.")
     
     # Logout button
     if st.sidebar.button("🚪 Logout"):
@@ -457,13 +616,7 @@ def main():
         return
 
     # Periodic pass checking
-    if (datetime.now() - st.session_state.last_checked).seconds >= 60:
-        for sat_name in st.session_state.favorites:
-            norad_id = SATELLITES.get(sat_name)
-            if norad_id:
-                get_next_passes(sat_name, norad_id, st.session_state.enable_notifications)
-        
-        st.session_state.last_checked = datetime.now()
+    watch_favorites()
 
     # Satellite selection
     st.title("ASAL Satellite Tracker")
@@ -504,9 +657,6 @@ def main():
     st.markdown("---")
     st.caption("Developed for Algerian Space Agency (ASAL) | Orbital data: Celestrak.org")
 
-    # Start dynamic countdown
-    update_countdown()
-
 # ----------------- APPLICATION LAUNCH -----------------
 if __name__ == "__main__":
     main()
\ No newline at end of file